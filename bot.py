@@ -20,11 +20,17 @@
 import os
 import asyncio
 import logging
+import random
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Mapping, NamedTuple, Tuple
 
 import aiohttp
 import discord
+import numba
+import numpy as np
+import orjson
+from aiolimiter import AsyncLimiter
 from discord.ext import tasks
 
 # --------------------------------------------------
@@ -49,53 +55,133 @@ if not ALPHA_KEY:
 
 CHANNEL_ID_INT = int(DISCORD_CHANNEL_ID)
 
-intents = discord.Intents.default()
-client = discord.Client(intents=intents)
+# Shared HTTP session (created in on_ready, closed on shutdown) so
+# keep-alive connections are pooled across loop iterations
+session: Optional[aiohttp.ClientSession] = None
 
-# Track what we've posted (dedupe)
-posted_news_ids: set = set()
+# Target channel, resolved once in on_ready
+channel: Optional[discord.TextChannel] = None
+
+class StockBot(discord.Client):
+    async def close(self):
+        global session
+        if session is not None and not session.closed:
+            await session.close()
+        session = None
+        await super().close()
+
+# The bot only sends messages (REST) and resolves its channel via
+# fetch_channel, so it subscribes to no gateway events at all
+intents = discord.Intents.none()
+client = StockBot(intents=intents)
+
+# Per-host concurrency caps (Alpha Vantage free tier is 5 req/min). The
+# connector's per-host pool must be at least as large, or requests queue for
+# a socket and the semaphores stop doing the limiting.
+HOST_CONN_LIMIT = 8
+AV_SEM = asyncio.Semaphore(5)
+POLY_SEM = asyncio.Semaphore(HOST_CONN_LIMIT)
+FETCH_RETRIES = 3
+# Per-API request rate, so pacing only kicks in near the limit
+AV_LIMIT = AsyncLimiter(5, 60)
+POLY_LIMIT = AsyncLimiter(100, 1)
+
+# Rolling 1-min bar buffer per symbol, oldest → newest
+class Bars(NamedTuple):
+    last_ts: str
+    closes: np.ndarray
+    highs: np.ndarray
+    lows: np.ndarray
+    vols: np.ndarray
+    vol_window_sum: int  # sum(vols[-25:-5]), the volume_spike baseline window
+
+BARS_MAXLEN = 200
+bars_cache: Dict[str, Bars] = {}
+
+# Conditional-GET validators from the last intraday response per symbol
+intraday_validators: Dict[str, Dict[str, str]] = {}
+
+# Track what we've posted (dedupe), bounded LRU keyed by news_signature()
+POSTED_NEWS_MAXLEN = 5000
+posted_news_ids: "OrderedDict[Tuple[str, Tuple[str, ...]], None]" = OrderedDict()
 
 # --------------------------------------------------
 # Helpers
 # --------------------------------------------------
-def ema(series: List[float], period: int) -> Optional[float]:
+def _make_ema_kernel(period: int):
+    # k and 1-k are closure constants, so numba folds them into the loop
+    k = 2 / (period + 1)
+    omk = 1 - k
+
+    @numba.njit(cache=True)
+    def kernel(arr: np.ndarray) -> float:
+        e = arr[0]
+        for i in range(1, arr.shape[0]):
+            e = arr[i] * k + e * omk
+        return e
+    return kernel
+
+# Kernels specialized per period; 9 and 21 are the ones we chart
+EMA_KERNELS = {9: _make_ema_kernel(9), 21: _make_ema_kernel(21)}
+
+def ema(series: np.ndarray, period: int) -> Optional[float]:
     if len(series) < period:
         return None
-    k = 2 / (period + 1)
-    e = series[0]
-    for x in series[1:]:
-        e = x * k + e * (1 - k)
-    return e
-
-def calc_vwap(prices: List[Tuple[float,float,float]], volumes: List[int]) -> Optional[float]:
-    # prices list of tuples: (high, low, close) 1-min bars
-    if not prices or not volumes or len(prices) != len(volumes):
+    kernel = EMA_KERNELS.get(period)
+    if kernel is None:
+        kernel = EMA_KERNELS[period] = _make_ema_kernel(period)
+    return float(kernel(np.ascontiguousarray(series, dtype=np.float64)))
+
+# Compile (or load the cached kernels) at import rather than on the first tick
+for _kernel in EMA_KERNELS.values():
+    _kernel(np.zeros(2, dtype=np.float64))
+
+def calc_vwap(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, volumes: np.ndarray) -> Optional[float]:
+    # 1-min bars; all arrays aligned oldest → newest
+    if not len(closes) or len(closes) != len(volumes):
         return None
-    cum_pv = 0.0
-    cum_v = 0
-    for (h,l,c), v in zip(prices, volumes):
-        typical = (h + l + c) / 3.0
-        cum_pv += typical * v
-        cum_v += v
+    cum_v = volumes.sum()
     if cum_v == 0:
         return None
-    return cum_pv / cum_v
+    typical = (highs + lows + closes) / 3.0
+    return float((typical * volumes).sum() / cum_v)
+
+async def fetch_raw(session: aiohttp.ClientSession, url: str, params: Dict[str, Any], sem: asyncio.Semaphore, limiter: AsyncLimiter, headers: Optional[Dict[str,str]]=None) -> Optional[Tuple[int, Mapping[str, str], bytes]]:
+    # returns (status, headers, body) for 200 / 304 responses, None otherwise
+    for attempt in range(FETCH_RETRIES):
+        try:
+            async with limiter, sem:
+                async with session.get(url, params=params, headers=headers) as r:
+                    if r.status in (200, 304):
+                        return r.status, r.headers, await r.read()
+                    if r.status != 429 and r.status < 500:
+                        logging.warning("HTTP %s for %s", r.status, url)
+                        return None
+                    logging.warning("HTTP %s for %s (attempt %d/%d)", r.status, url, attempt + 1, FETCH_RETRIES)
+        except Exception as e:
+            logging.exception("fetch error: %s", e)
+            return None
+        # Back off outside the semaphore so other requests can proceed
+        if attempt + 1 < FETCH_RETRIES:
+            await asyncio.sleep(2 ** attempt + random.random())
+    return None
 
-async def fetch_json(session: aiohttp.ClientSession, url: str, params: Dict[str, Any], headers: Optional[Dict[str,str]]=None) -> Optional[Dict[str, Any]]:
+async def fetch_json(session: aiohttp.ClientSession, url: str, params: Dict[str, Any], sem: asyncio.Semaphore, limiter: AsyncLimiter, headers: Optional[Dict[str,str]]=None) -> Optional[Dict[str, Any]]:
+    resp = await fetch_raw(session, url, params, sem, limiter, headers)
+    if not resp or resp[0] != 200:
+        return None
     try:
-        async with session.get(url, params=params, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as r:
-            if r.status != 200:
-                logging.warning("HTTP %s for %s", r.status, url)
-                return None
-            return await r.json()
-    except Exception as e:
-        logging.exception("fetch_json error: %s", e)
+        return orjson.loads(resp[2])
+    except ValueError as e:
+        logging.warning("bad JSON from %s: %s", url, e)
         return None
 
 # --------------------------------------------------
 # Alpha Vantage: intraday + news
 # --------------------------------------------------
-async def get_intraday(session: aiohttp.ClientSession, symbol: str) -> Optional[Dict[str, Any]]:
+async def get_intraday(session: aiohttp.ClientSession, symbol: str) -> Optional[Bars]:
+    # Alpha Vantage has no "bars since" query, so the compact payload is always
+    # fetched; only bars newer than the cached buffer get parsed.
     params = {
         "function": "TIME_SERIES_INTRADAY",
         "symbol": symbol,
@@ -103,37 +189,92 @@ async def get_intraday(session: aiohttp.ClientSession, symbol: str) -> Optional[
         "outputsize": "compact",
         "apikey": ALPHA_KEY,
     }
-    return await fetch_json(session, "https://www.alphavantage.co/query", params)
+    resp = await fetch_raw(session, "https://www.alphavantage.co/query", params, AV_SEM, AV_LIMIT, intraday_validators.get(symbol))
+    if not resp:
+        return None
+    status, resp_headers, body = resp
+    if status == 304:
+        return bars_cache.get(symbol)
+    try:
+        bars = update_bars(symbol, orjson.loads(body))
+    except ValueError as e:
+        logging.warning("bad intraday JSON for %s: %s", symbol, e)
+        return None
+    if bars:
+        validators = {}
+        if resp_headers.get("ETag"):
+            validators["If-None-Match"] = resp_headers["ETag"]
+        if resp_headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = resp_headers["Last-Modified"]
+        intraday_validators[symbol] = validators
+    return bars
 
-def parse_intraday(series_json: Dict[str, Any]) -> Optional[Tuple[List[float], List[Tuple[float,float,float]], List[int], float]]:
-    # returns (closes_desc, hlc_desc, volumes_desc, last_close)
+def parse_intraday(series_json: Dict[str, Any], since: Optional[str] = None) -> Optional[Tuple[Bars, bool]]:
+    # returns (bars newer than `since`, whether `since` was reached), oldest → newest
     try:
         ts = series_json.get("Time Series (1min)") or {}
         if not ts:
             return None
-        # Alpha returns newest first when sorted descending by timestamp
-        items = sorted(ts.items(), key=lambda kv: kv[0])  # oldest → newest
-        closes = []
-        hlc = []
-        vols = []
-        for _, v in items:
-            close = float(v["4. close"])
-            high = float(v["2. high"])
-            low  = float(v["3. low"])
-            vol  = int(float(v["5. volume"]))
-            closes.append(close)
-            hlc.append((high, low, close))
-            vols.append(vol)
-        return closes, hlc, vols, closes[-1]
+        # Alpha returns newest first, so walk forward until we hit bars we already have
+        if __debug__ and len(ts) > 1:
+            assert next(iter(ts)) > next(reversed(ts)), "Alpha Vantage series no longer newest-first"
+        fresh = []
+        reached = since is None
+        for key, v in ts.items():
+            if since is not None and key <= since:
+                reached = True
+                break
+            fresh.append(v)
+        n = len(fresh)
+        closes = np.empty(n, dtype=np.float64)
+        highs = np.empty(n, dtype=np.float64)
+        lows = np.empty(n, dtype=np.float64)
+        vols = np.empty(n, dtype=np.int64)
+        for i, v in enumerate(reversed(fresh)):
+            closes[i] = float(v["4. close"])
+            highs[i] = float(v["2. high"])
+            lows[i] = float(v["3. low"])
+            vols[i] = int(float(v["5. volume"]))
+        last_ts = next(iter(ts)) if n else since
+        return Bars(last_ts, closes, highs, lows, vols, int(vols[-25:-5].sum())), reached
     except Exception as e:
         logging.exception("parse_intraday error: %s", e)
         return None
 
-def volume_spike(vols: List[int]) -> Optional[Tuple[float, int]]:
+def update_bars(symbol: str, series_json: Dict[str, Any]) -> Optional[Bars]:
+    cached = bars_cache.get(symbol)
+    parsed = parse_intraday(series_json, cached.last_ts if cached else None)
+    if not parsed:
+        return None
+    fresh, contiguous = parsed
+    if cached is None or not contiguous:
+        # cold start, or a gap since the last tick: start over from this payload
+        bars = fresh
+    elif not len(fresh.closes):
+        bars = cached
+    else:
+        n, added = len(cached.vols), len(fresh.vols)
+        closes, highs, lows, vols = (
+            np.concatenate((old, new)) for old, new in zip(cached[1:5], fresh[1:5])
+        )
+        if n >= 25 and added <= 20:
+            # slide the baseline window forward by `added` bars
+            window_sum = cached.vol_window_sum + int(vols[n - 5:n - 5 + added].sum()) - int(vols[n - 25:n - 25 + added].sum())
+        else:
+            window_sum = int(vols[-25:-5].sum())
+        bars = Bars(
+            fresh.last_ts,
+            closes[-BARS_MAXLEN:], highs[-BARS_MAXLEN:], lows[-BARS_MAXLEN:], vols[-BARS_MAXLEN:],
+            window_sum,
+        )
+    bars_cache[symbol] = bars
+    return bars
+
+def volume_spike(vols: np.ndarray, window_sum: int) -> Optional[Tuple[float, int]]:
     if len(vols) < 25:
         return None
-    baseline = sum(vols[-25:-5]) / 20.0  # last ~20 bars excluding latest 5 bars
-    current = vols[-1]
+    baseline = window_sum / 20.0  # last ~20 bars excluding latest 5 bars
+    current = int(vols[-1])
     if baseline <= 0:
         return None
     ratio = current / baseline
@@ -150,20 +291,35 @@ async def get_news(session: aiohttp.ClientSession, symbols: List[str]) -> List[D
         "limit": 30,
         "sort": "LATEST"
     }
-    data = await fetch_json(session, "https://www.alphavantage.co/query", params)
+    data = await fetch_json(session, "https://www.alphavantage.co/query", params, AV_SEM, AV_LIMIT)
     feed = data.get("feed", []) if data else []
     # Normalize
     news = []
+    seen = set()
     for item in feed:
-        uid = item.get("uuid") or item.get("url")
-        if not uid or uid in posted_news_ids:
+        tickers = [t.get("ticker") for t in item.get("ticker_sentiment", []) if t.get("ticker")]
+        sig = news_signature(item.get("title") or "", tickers)
+        if sig in posted_news_ids:
+            posted_news_ids.move_to_end(sig)  # still in the feed; keep it fresh
+            continue
+        if not sig[0] or sig in seen:
             continue
-        headline = item.get("title") or "News"
+        seen.add(sig)
+        headline = item.get("title")
         url = item.get("url")
-        tickers = [t.get("ticker") for t in item.get("ticker_sentiment", []) if t.get("ticker")]
-        news.append({"id": uid, "headline": headline, "url": url, "tickers": tickers})
+        news.append({"id": sig, "headline": headline, "url": url, "tickers": tickers})
     return news[:10]
 
+def news_signature(title: str, tickers: List[str]) -> Tuple[str, Tuple[str, ...]]:
+    # Title + primary ticker, so wire reprints with fresh UUIDs still collapse
+    return title.strip().lower(), tuple(sorted(tickers))[:1]
+
+def remember_news(sig: Tuple[str, Tuple[str, ...]]) -> None:
+    posted_news_ids[sig] = None
+    posted_news_ids.move_to_end(sig)
+    if len(posted_news_ids) > POSTED_NEWS_MAXLEN:
+        posted_news_ids.popitem(last=False)
+
 # --------------------------------------------------
 # Polygon: simple options flow snapshot (best-effort)
 # --------------------------------------------------
@@ -174,113 +330,186 @@ async def polygon_options_flow(session: aiohttp.ClientSession, symbol: str) -> O
     # If Polygon returns error or endpoint differs, we fail gracefully.
     url = f"https://api.polygon.io/v3/snapshot/options/{symbol}"
     params = {"apiKey": POLYGON_KEY}
-    data = await fetch_json(session, url, params)
+    data = await fetch_json(session, url, params, POLY_SEM, POLY_LIMIT)
     if not data:
         return None
-    # Attempt to summarize calls vs puts volume if present
+    # Attempt to summarize calls vs puts volume if present (single pass)
     try:
         results = data.get("results") or []
-        calls_vol = sum(int(x.get("day", {}).get("volume", 0)) for x in results if x.get("details", {}).get("contract_type") == "call")
-        puts_vol  = sum(int(x.get("day", {}).get("volume", 0)) for x in results if x.get("details", {}).get("contract_type") == "put")
+        calls_vol = puts_vol = 0
+        for x in results:
+            ctype = (x.get("details") or {}).get("contract_type")
+            if ctype == "call":
+                calls_vol += (x.get("day") or {}).get("volume") or 0
+            elif ctype == "put":
+                puts_vol += (x.get("day") or {}).get("volume") or 0
         if calls_vol == 0 and puts_vol == 0:
             return None
-        return {"calls": calls_vol, "puts": puts_vol}
+        return {"calls": int(calls_vol), "puts": int(puts_vol)}
     except Exception:
         return None
 
 # --------------------------------------------------
 # Discord tasks
 # --------------------------------------------------
-async def ensure_channel() -> discord.TextChannel:
-    await client.wait_until_ready()
-    ch = client.get_channel(CHANNEL_ID_INT)
-    if ch is None:
-        ch = await client.fetch_channel(CHANNEL_ID_INT)
-    if not isinstance(ch, discord.TextChannel):
-        raise RuntimeError("DISCORD_CHANNEL_ID is not a text channel.")
-    return ch
+DISCORD_MSG_LIMIT = 2000
+
+def chunk_lines(lines: List[str], limit: int) -> List[str]:
+    chunks = []
+    current = ""
+    for line in lines:
+        line = line[:limit]
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def resolve_channel() -> Optional[discord.TextChannel]:
+    # Fetched once. Transient failures are retried on the next loop tick;
+    # a misconfigured DISCORD_CHANNEL_ID shuts the bot down.
+    global channel
+    if channel is None:
+        try:
+            ch = await client.fetch_channel(CHANNEL_ID_INT)
+        except discord.HTTPException as e:
+            if e.status >= 500:
+                logging.warning("fetch channel failed: %s", e)
+                return None
+            logging.error("Cannot access DISCORD_CHANNEL_ID %s: %s", CHANNEL_ID_INT, e)
+            await client.close()
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logging.warning("fetch channel failed: %s", e)
+            return None
+        except discord.InvalidData:
+            ch = None
+        if not isinstance(ch, discord.TextChannel):
+            logging.error("DISCORD_CHANNEL_ID is not a text channel.")
+            await client.close()
+            return None
+        channel = ch
+    return channel
 
 @client.event
 async def on_ready():
+    global session
     logging.info("Logged in as %s", client.user)
+    await resolve_channel()
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=HOST_CONN_LIMIT,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+                keepalive_timeout=90,
+            ),
+            # Per-phase timeouts so a stuck socket can't hold up the next tick
+            timeout=aiohttp.ClientTimeout(total=30, sock_connect=5, sock_read=20),
+        )
     if not price_loop.is_running():
         price_loop.start()
     if not news_loop.is_running():
         news_loop.start()
 
+async def handle_symbol(session: aiohttp.ClientSession, sym: str) -> Optional[str]:
+    # Intraday and options flow are independent requests, so fetch them together
+    bars, snap = await asyncio.gather(get_intraday(session, sym), polygon_options_flow(session, sym))
+    if not bars or not len(bars.closes):
+        return None
+    _, closes, highs, lows, vols, vol_window_sum = bars
+    last = float(closes[-1])
+    change = last - closes[-2] if len(closes) > 1 else 0.0
+    up = change >= 0
+    dot = "🟢" if up else "🔴"
+
+    ema9 = ema(closes[-50:], 9)
+    ema21 = ema(closes[-50:], 21)
+    vwap_val = calc_vwap(highs[-120:], lows[-120:], closes[-120:], vols[-120:])
+
+    spike_txt = ""
+    spike = volume_spike(vols, vol_window_sum)
+    if spike:
+        ratio, curv = spike
+        spike_txt = f" • Vol spike {ratio:.1f}×"
+
+    ema_txt = ""
+    if ema9 and ema21:
+        trend = "↑" if ema9 > ema21 else "↓"
+        ema_txt = f" • EMA9/21: {ema9:.2f}/{ema21:.2f} {trend}"
+
+    vwap_txt = f" • VWAP: {vwap_val:.2f}" if vwap_val else ""
+
+    poly_txt = ""
+    if snap:
+        poly_txt = f" • Opts flow C/P: {snap['calls']}/{snap['puts']}"
+
+    return f"{dot} **{sym}** {last:.2f} ({change:+.2f}){spike_txt}{ema_txt}{vwap_txt}{poly_txt}"
+
 @tasks.loop(seconds=PRICE_LOOP_SECONDS)
 async def price_loop():
-    ch = await ensure_channel()
-    async with aiohttp.ClientSession() as session:
-        for sym in TICKERS:
-            series = await get_intraday(session, sym)
-            if not series:
-                continue
-            parsed = parse_intraday(series)
-            if not parsed:
-                continue
-            closes, hlc, vols, last = parsed
-            change = last - closes[-2] if len(closes) > 1 else 0.0
-            up = change >= 0
-            dot = "🟢" if up else "🔴"
-
-            ema9 = ema(closes[-50:], 9)
-            ema21 = ema(closes[-50:], 21)
-            vwap_val = calc_vwap(hlc[-120:], vols[-120:])
-
-            spike_txt = ""
-            spike = volume_spike(vols)
-            if spike:
-                ratio, curv = spike
-                spike_txt = f" • Vol spike {ratio:.1f}×"
-
-            ema_txt = ""
-            if ema9 and ema21:
-                trend = "↑" if ema9 > ema21 else "↓"
-                ema_txt = f" • EMA9/21: {ema9:.2f}/{ema21:.2f} {trend}"
-
-            vwap_txt = f" • VWAP: {vwap_val:.2f}" if vwap_val else ""
-
-            poly_txt = ""
-            if POLYGON_KEY:
-                snap = await polygon_options_flow(session, sym)
-                if snap:
-                    poly_txt = f" • Opts flow C/P: {snap['calls']}/{snap['puts']}"
-
-            msg = f"{dot} **{sym}** {last:.2f} ({change:+.2f}){spike_txt}{ema_txt}{vwap_txt}{poly_txt}"
-            try:
-                await ch.send(msg)
-            except Exception as e:
-                logging.warning("send price msg failed: %s", e)
-            await asyncio.sleep(1.2)  # small spacing; also helps with rate limits
+    ch = await resolve_channel()
+    if ch is None:
+        return
+    msgs = await asyncio.gather(*[handle_symbol(session, sym) for sym in TICKERS], return_exceptions=True)
+    lines = []
+    for sym, msg in zip(TICKERS, msgs):
+        if isinstance(msg, BaseException):
+            logging.warning("price update for %s failed: %s", sym, msg)
+        elif msg:
+            lines.append(msg)
+    # One message per tick (split only if it exceeds Discord's length limit)
+    for chunk in chunk_lines(lines, DISCORD_MSG_LIMIT):
+        try:
+            await ch.send(chunk)
+        except Exception as e:
+            logging.warning("send price msg failed: %s", e)
 
 @tasks.loop(seconds=NEWS_LOOP_SECONDS)
 async def news_loop():
-    ch = await ensure_channel()
-    async with aiohttp.ClientSession() as session:
-        news = await get_news(session, TICKERS)
-        if not news:
-            return
-        for n in news:
-            posted_news_ids.add(n["id"])
-            tickers_txt = ", ".join(n["tickers"]) if n["tickers"] else ""
-            title = n["headline"]
-            url = n["url"] or ""
-            embed = discord.Embed(title=title, description=tickers_txt, timestamp=datetime.now(timezone.utc))
-            if url:
-                embed.url = url
-            embed.set_footer(text="Alpha Vantage News")
-            try:
-                await ch.send(embed=embed)
-            except Exception as e:
-                logging.warning("send news failed: %s", e)
-            await asyncio.sleep(1.0)
+    ch = await resolve_channel()
+    if ch is None:
+        return
+    news = await get_news(session, TICKERS)
+    if not news:
+        return
+    for n in news:
+        remember_news(n["id"])
+        tickers_txt = ", ".join(n["tickers"]) if n["tickers"] else ""
+        title = n["headline"]
+        url = n["url"] or ""
+        embed = discord.Embed(title=title, description=tickers_txt, timestamp=datetime.now(timezone.utc))
+        if url:
+            embed.url = url
+        embed.set_footer(text="Alpha Vantage News")
+        try:
+            await ch.send(embed=embed)
+        except Exception as e:
+            logging.warning("send news failed: %s", e)
 
 # --------------------------------------------------
 # Run
 # --------------------------------------------------
+async def _runner():
+    async with client:
+        await client.start(DISCORD_TOKEN)
+
 def main():
-    client.run(DISCORD_TOKEN)
+    try:
+        import uvloop
+    except ImportError:
+        # e.g. Windows dev machines; fall back to the default asyncio loop
+        client.run(DISCORD_TOKEN)
+        return
+    # uvloop.run uses a loop factory rather than the deprecated policy API
+    try:
+        uvloop.run(_runner())
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == "__main__":
     main()